@@ -0,0 +1,61 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy below
+    njit = None
+
+
+def _build_mask_loop(lead, adr, q_lead, q_adr):
+    """
+    Return a boolean mask of rows with lead <= q_lead and adr <= q_adr.
+
+    Compiled with numba when it is installed.
+    """
+    mask = np.empty(lead.shape[0], dtype=np.bool_)
+    for i in range(lead.shape[0]):
+        mask[i] = lead[i] <= q_lead and adr[i] <= q_adr
+    return mask
+
+
+def _fillna_int_loop(arr, mask, fill, out):
+    """
+    Copy the rows selected by `mask` into the integer array `out`,
+    replacing NaN with `fill`, in one pass.
+
+    Compiled with numba when it is installed.
+    """
+    j = 0
+    for i in range(arr.shape[0]):
+        if mask[i]:
+            value = arr[i]
+            # value != value is only true for NaN and also works on int input
+            out[j] = fill if value != value else value
+            j += 1
+    return out
+
+
+def _build_mask_numpy(lead, adr, q_lead, q_adr):
+    """
+    NumPy fallback for _build_mask_loop.
+    """
+    return (lead <= q_lead) & (adr <= q_adr)
+
+
+def _fillna_int_numpy(arr, mask, fill, out):
+    """
+    NumPy fallback for _fillna_int_loop, writing into the same output array.
+    """
+    selected = arr[mask]
+    if selected.dtype.kind == "f":
+        selected = np.where(np.isnan(selected), fill, selected)
+    out[:] = selected
+    return out
+
+
+if njit is not None:
+    _build_mask = njit(cache=True)(_build_mask_loop)
+    _fillna_int = njit(cache=True)(_fillna_int_loop)
+else:
+    _build_mask = _build_mask_numpy
+    _fillna_int = _fillna_int_numpy
@@ -1,6 +1,19 @@
 import pandas as pd
 import numpy as np
 
+from ._cleaning_kernels import _build_mask, _fillna_int
+
+# Domain-specific fill values for missing entries
+FILL_VALUES = {"children": 0, "country": "Donno", "agent": 0, "company": 0}
+
+# Narrow integer dtypes for the filled identifier/count columns
+ID_DTYPES = {"agent": "int32", "company": "int32", "children": "int8"}
+
+# Compact dtypes for all filled columns: the IDs/counts above plus a
+# dictionary-encoded category for the ~180 country codes
+CLEAN_DTYPES = {**ID_DTYPES, "country": "category"}
+
+
 def drop_high_na_columns(df, threshold=0.99):       
     """
     This function identifies columns whose share of missing values exceeds
@@ -20,47 +33,63 @@ def drop_high_na_columns(df, threshold=0.99):
         ValueError: If `threshold` is not between 0 and 1.
     """
     # Drop high NAN-Value columns
-    high_nan = df.isna().mean()
-    cols_to_drop = high_nan[high_nan > threshold].index
+    cols_to_drop = _high_na_columns(df, threshold)
     return df.drop(columns=cols_to_drop), list(cols_to_drop)
 
 
+def _high_na_columns(df, threshold):
+    """
+    Return the columns whose share of missing values exceeds `threshold`.
+
+    Missing values are counted per column and compared against
+    `threshold * len(df)`, so no mean over a boolean frame is needed.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame.
+        threshold (float): Proportion of allowed missing values.
+
+    Returns:
+        pandas.Index: Names of the columns above the threshold.
+    """
+    counts = df.isna().sum()
+    return counts.index[counts.to_numpy() > threshold * len(df)]
+
+
 def fill_missing_values(df):
     """
-    Fill missing values using domain-specific rules.
+    Fill missing values using domain-specific rules and downcast the result.
 
-    This function applies custom imputation strategies:
+    This function applies custom imputation strategies in a single call:
     - children: missing values are replaced with 0
     - country: missing values are replaced with "Donno"
     - agent/company: missing values are replaced with 0
+
+    Afterwards agent/company are stored as int32, children as int8 and
+    country as a pandas category.
     
     Args:
         df (pandas.DataFrame): Input DataFrame with missing values.
     
     Returns:
-        pandas.DataFrame: DataFrame with filled missing 
+        pandas.DataFrame: DataFrame with filled missing values and
+            corrected datatypes.
     """
-    # children: replace 4 missing values with 0
-    df["children"] = df["children"].fillna(0)
-
-    # country: replace missing with 'Donno'
-    df["country"] = df["country"].fillna("Donno")
-
-    # agent, company: replace missing IDs with 0
-    df["agent"] = df["agent"].fillna(0)
-    df["company"] = df["company"].fillna(0)
+    # Fill all columns at once instead of one fillna per column
+    df.fillna(FILL_VALUES, inplace=True)
 
-    return df
+    # Once filled, the IDs and counts fit into narrow integer types and
+    # country is stored as integer codes plus a small category dictionary
+    return df.astype(CLEAN_DTYPES, copy=False)
 
 
 def fix_dtypes(df):
     """
     Ensure correct datatypes after filling missing values.
 
-    This function converts numeric identifier columns to integer type:
-    - agent
-    - company
-    - children
+    This function converts numeric identifier columns to narrow integer types:
+    - agent (int32)
+    - company (int32)
+    - children (int8)
     
     Args:
         df (pandas.DataFrame): Input DataFrame.
@@ -71,12 +100,8 @@ def fix_dtypes(df):
     Raises:
         ValueError: If required columns are missing or contain non-numeric values.
     """
-    # Convert numeric IDs to integers
-    df["agent"] = df["agent"].astype(int)
-    df["company"] = df["company"].astype(int)
-    df["children"] = df["children"].astype(int)
-
-    return df
+    # Convert numeric IDs to narrow integers in a single astype call
+    return df.astype(ID_DTYPES, copy=False)
 
 
 def remove_outliers(df):
@@ -86,6 +111,9 @@ def remove_outliers(df):
     This function removes rows with unrealistic values:
     - lead_time: rows above the 99th percentile are removed
     - adr: rows above the 99th percentile are removed
+
+    Both percentiles are taken on the input frame and applied as one
+    combined mask, so the data is sliced only once.
     
     Args:
         df (pandas.DataFrame): Input dataset.
@@ -94,26 +122,56 @@ def remove_outliers(df):
         pandas.DataFrame: Cleaned DataFrame with outliers removed.
     """
     # Lead time: remove top 1% outliers because nobody will book 2 years in advance
-    q99_lead = df["lead_time"].quantile(0.99)
-    df = df[df["lead_time"] <= q99_lead]
-
     # ADR: remove top 1% (very high nightly price) => 5400$ is unrealisticly high 
-    q99_adr = df["adr"].quantile(0.99)
-    df = df[df["adr"] <= q99_adr]
+    # The mask is a bare boolean ndarray, so iloc skips Series alignment.
+    return df.iloc[_outlier_mask(df)]
+
+
+def _outlier_mask(df):
+    """
+    Build the boolean row mask used by remove_outliers.
+
+    Both 99th percentiles are selected with np.partition (introselect, O(n))
+    instead of a full sort. The mask is built directly on the underlying
+    NumPy arrays, so no intermediate DataFrame or boolean Series is created.
+
+    Args:
+        df (pandas.DataFrame): Input dataset.
+
+    Returns:
+        numpy.ndarray: Boolean array, True for rows to keep.
+    """
+    # An empty frame has no quantiles; keep (nothing) instead of failing
+    if len(df) == 0:
+        return np.ones(0, dtype=bool)
+
+    lead_arr = df["lead_time"].to_numpy()
+    adr_arr = df["adr"].to_numpy()
 
-    return df
+    # The linear-interpolated quantile lies between the k-th and (k+1)-th
+    # smallest values, so comparing with "<=" against the k-th value keeps
+    # exactly the same rows.
+    k = int(0.99 * (len(df) - 1))
+    q99_lead = np.partition(lead_arr, k)[k]
+    q99_adr = np.partition(adr_arr, k)[k]
+    return _build_mask(lead_arr, adr_arr, q99_lead, q99_adr)
 
 
 def clean_dataset(df):
     """
-    Run the full cleaning pipeline in the correct order.
-
-    This function executes all preprocessing steps:
-    1. Drop columns with excessive missing values
-    2. Fill missing values using domain rules
-    3. Correct datatypes
-    4. Remove extreme outliers
-    5. Reset index
+    Run the full cleaning pipeline in a single pass.
+
+    This function executes all preprocessing steps while copying the data
+    only once:
+    1. Determine columns with excessive missing values
+    2. Build one outlier mask for lead_time and adr
+    3. Select surviving rows and columns in one step and reset the index
+    4. Fill and cast the numeric ID columns in one fused kernel pass
+    5. Fill the remaining missing values and correct datatypes
+
+    Outliers are removed before filling and casting, so steps 4 and 5 only
+    touch the rows that are kept. This is safe because lead_time and adr
+    contain no missing values, i.e. the mask does not depend on the fill.
     
     Args:
         df (pandas.DataFrame): Raw input dataset.
@@ -123,11 +181,30 @@ def clean_dataset(df):
             pandas.DataFrame: Fully cleaned dataset.
             list[str]: Names of columns dropped due to high NA share.
     """
-    # Run pipeline
-    df_clean, dropped_cols = drop_high_na_columns(df)
-    df_clean = fill_missing_values(df_clean)
-    df_clean = fix_dtypes(df_clean)
-    df_clean = remove_outliers(df_clean)
+    # Drop high NAN-Value columns (same rule as drop_high_na_columns)
+    dropped_cols = list(_high_na_columns(df, 0.99))
+    keep_cols = df.columns.drop(dropped_cols)
+
+    # Remove top 1% of lead_time and adr (same rule as remove_outliers),
+    # combined into one mask so the frame is only sliced once. This runs
+    # before any fill/cast so those steps skip the dropped rows.
+    mask = _outlier_mask(df)
+
+    # The only copy of the data: surviving rows and columns at once. The
+    # numeric ID/count columns are left out and built by the kernel below.
+    id_cols = [col for col in keep_cols if col in ID_DTYPES]
+    df_clean = df.loc[mask, keep_cols.drop(id_cols)]
     df_clean.reset_index(drop=True, inplace=True)
 
+    # Numeric ID/count columns: select, fill and cast in one fused pass
+    # straight from the raw arrays, inserted back at their original position
+    n_rows = len(df_clean)
+    for col in id_cols:
+        out = np.empty(n_rows, dtype=ID_DTYPES[col])
+        _fillna_int(df[col].to_numpy(), mask, FILL_VALUES[col], out)
+        df_clean.insert(keep_cols.get_loc(col), col, out)
+
+    # Fill the remaining columns (country) and fix their datatypes
+    df_clean = fill_missing_values(df_clean)
+
     return df_clean, dropped_cols
@@ -1,6 +1,43 @@
+import warnings
+
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain NumPy below
+    njit = None
+    prange = range
+
+
+def _engineer_loop(wkd, wk, adults, ch, bab, out_stay, out_guests):
+    """
+    Compute total_stay and total_guests in one fused pass over the rows.
+
+    Compiled with numba (parallel over rows) when it is installed.
+    """
+    for i in prange(wkd.shape[0]):
+        out_stay[i] = wkd[i] + wk[i]
+        out_guests[i] = adults[i] + ch[i] + bab[i]
+
+
+def _engineer_numpy(wkd, wk, adults, ch, bab, out_stay, out_guests):
+    """
+    NumPy fallback for _engineer_loop, writing into the same output arrays.
+    """
+    np.add(wkd, wk, out=out_stay, casting="unsafe")
+    np.add(adults, ch, out=out_guests, casting="unsafe")
+    np.add(out_guests, bab, out=out_guests, casting="unsafe")
+
+
+if njit is not None:
+    _engineer = njit(parallel=True, cache=True)(_engineer_loop)
+else:
+    _engineer = _engineer_numpy
+
+
 class HotelTransformer:
     """
     Transformation pipeline for hotel booking data.
@@ -25,6 +62,12 @@ class HotelTransformer:
         self.encoder: OneHotEncoder | None = None
         self.scaler: StandardScaler | None = None
 
+        # Category labels per categorical column, learned once in fit
+        self._categorical_levels: dict[str, pd.Index] = {}
+
+        # Names of the one-hot encoded columns, computed once in fit
+        self._encoded_colnames: list[str] = []
+
     # ---------- internal helpers ----------
 
     def add_engineered_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -37,33 +80,89 @@ class HotelTransformer:
             - "total_stay": Sum of weekday and weekend stays.
             - "total_guests": Total number of guests (adults + children + babies).
 
+        The columns are added to `df` in place; no defensive copy is made.
+        Callers that need to keep their original frame unchanged must pass
+        a copy. The input is expected to come from `clean_dataset`, i.e.
+        "children" contains no missing values.
+
         Args:
             df (pandas.DataFrame): Input DataFrame containing the original
                 hotel booking data.
 
         Returns:
-            pandas.DataFrame: A new DataFrame containing all original columns
-                plus the newly engineered feature columns.
+            pandas.DataFrame: The same DataFrame, now containing the newly
+                engineered feature columns.
 
         Raises:
             KeyError: If any of the required columns for feature creation
                 are missing from the input DataFrame.
         """
-       
-        df["total_stay"] = (
-            df["stays_in_weekend_nights"] + df["stays_in_week_nights"]
-        )
-        df["total_guests"] = (
-            df["adults"] + df["children"].fillna(0) + df["babies"]
+        # Compute both features in one pass over the underlying NumPy arrays
+        # (numba kernel if available) into preallocated int32 outputs.
+        n_rows = len(df)
+        total_stay = np.empty(n_rows, dtype=np.int32)
+        total_guests = np.empty(n_rows, dtype=np.int32)
+        _engineer(
+            df["stays_in_weekend_nights"].to_numpy(),
+            df["stays_in_week_nights"].to_numpy(),
+            df["adults"].to_numpy(),
+            df["children"].to_numpy(),
+            df["babies"].to_numpy(),
+            total_stay,
+            total_guests,
         )
+        df["total_stay"] = total_stay
+        df["total_guests"] = total_guests
         return df
 
+    def _encoder_input(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build the input frame for the OneHotEncoder.
+
+        Every categorical column is replaced by its integer codes, aligned to
+        the categories learned in fit, so the encoder works on small
+        integers instead of hashing strings. Values not seen during fit
+        (and missing values) get code -1 and are ignored by the encoder.
+
+        Args:
+            df (pandas.DataFrame): The DataFrame containing categorical columns.
+
+        Returns:
+            pandas.DataFrame: Frame with one integer code column per entry
+                in cat_cols.
+        """
+        return pd.DataFrame(
+            {
+                col: pd.Categorical(df[col], categories=levels).codes
+                for col, levels in self._categorical_levels.items()
+            },
+            index=df.index,
+        )
+
+    def _feature_names(self) -> list[str]:
+        """
+        Return the names of the one-hot encoded output columns.
+
+        Names follow the OneHotEncoder convention "<column>_<category>", using
+        the category labels learned in fit rather than the integer codes.
+
+        Returns:
+            list[str]: Encoded column names in encoder output order.
+        """
+        return [
+            f"{col}_{label}"
+            for col, levels in self._categorical_levels.items()
+            for label in levels
+        ]
+
     def _encode_categorical(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply one-hot encoding to categorical columns using a fitted encoder.
 
         This function transforms the categorical variables into one-hot encoded
-        vectors. The encoder must be fitted beforehand using the fit() or
+        vectors. The encoded columns are stored as sparse float32 columns,
+        since high-cardinality features such as country are almost entirely
+        zeros. The encoder must be fitted beforehand using the fit() or
         fit_transform() method.
 
         Args:
@@ -84,21 +183,22 @@ class HotelTransformer:
 
         if self.encoder is None:
             raise RuntimeError("Encoder is not fitted. Call `fit` or `fit_transform` first.")
-        # Transform the categorical columns into one-hot encoded arrays.
-        encoded = self.encoder.transform(df[self.cat_cols])
+        # Transform the categorical columns into a sparse one-hot matrix.
+        encoded = self.encoder.transform(self._encoder_input(df))
         
-        # Convert the encoded numpy array into a DataFrame with proper column names
-        # and aligned index so it can be concatenated back into the original df.
-        encoded_df = pd.DataFrame(
-            encoded,
-            columns=self.encoder.get_feature_names_out(self.cat_cols),
-            index=df.index,
-        )
         # Drop original categorical columns from the DataFrame.
         df = df.drop(columns=self.cat_cols)
 
-        # Concatenate the encoded columns to the remaining DataFrame.
-        df = pd.concat([df, encoded_df], axis=1)
+        # Append the encoded columns one by one as sparse arrays instead of
+        # concatenating a second frame, which would copy every remaining
+        # column. CSC format makes the per-column slices cheap. Each sparse
+        # column is its own extension block that consolidation could not
+        # merge anyway, so pandas' fragmentation warning does not apply.
+        encoded = encoded.tocsc()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+            for i, name in enumerate(self._encoded_colnames):
+                df[name] = pd.arrays.SparseArray.from_spmatrix(encoded[:, i])
 
         return df
 
@@ -107,7 +207,8 @@ class HotelTransformer:
         Scale numerical columns using a fitted StandardScaler.
 
         This function applies z-score scaling (mean = 0, std = 1) to the
-        numerical features. Scaling is optional and controlled by the
+        numerical features in float32, which is ample precision for stays,
+        prices and lead times. Scaling is optional and controlled by the
         do_scaling flag. The scaler must be fitted beforehand.
 
         Args:
@@ -132,53 +233,116 @@ class HotelTransformer:
         # If not, the user likely called transform() before fit() or fit_transform().
         if self.scaler is None:
             raise RuntimeError("Scaler is not fitted. Call `fit` or `fit_transform`   first.")
-        # Apply the fitted StandardScaler to the numerical columns.
-        df[self.num_cols] = self.scaler.transform(df[self.num_cols])
+        # Extract the numeric block once as a fresh float32 array and let the
+        # fitted StandardScaler (copy=False) standardize it in place before
+        # writing it back into the numerical columns.
+        arr = df[self.num_cols].to_numpy(dtype=np.float32)
+        df[self.num_cols] = self.scaler.transform(arr, copy=False)
         
         return df
 
-    # ---------- public API (sklearn-like) ----------
-
-    def fit(self, df: pd.DataFrame):
+    def _fit_engineered(self, df_tmp: pd.DataFrame):
         """
-        Fit the encoder and scaler on the provided training DataFrame.
-
-        This method prepares the transformation pipeline by fitting the
-        OneHotEncoder on categorical columns and the StandardScaler on
-        numerical columns. It should only be called on the training data.
+        Fit the encoder and scaler on a DataFrame that already contains the
+        engineered features.
 
         Args:
-            df (pandas.DataFrame): Input training DataFrame used to learn
-                categorical values and scaling statistics.
+            df_tmp (pandas.DataFrame): Training DataFrame returned by
+                add_engineered_features.
 
         Returns:
             HotelTransformer: The fitted transformer instance.
         """
-        
-        # First, apply feature engineering so that new columns are included
-        # when fitting both the encoder and the scaler.
-        df_tmp = self.add_engineered_features(df)
-
-        
         # Fit OneHotEncoder on categorical columns (if any are provided).
         # This learns all unique categories and prepares the encoder for
         # transforming both train and test data consistently.
         if self.cat_cols:
+            # Build the category dictionary of each column once (sorted labels
+            # for plain string columns). Columns that already have a category
+            # dtype (e.g. country after cleaning) reuse theirs; unused
+            # categories are dropped so only values seen in the training data
+            # get an output column.
+            self._categorical_levels = {}
+            for col in self.cat_cols:
+                values = df_tmp[col]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.cat.remove_unused_categories()
+                else:
+                    values = values.astype("category")
+                self._categorical_levels[col] = values.cat.categories
+
+            # The encoder only ever sees the integer codes 0..n-1, so its
+            # categories are known upfront and transform reduces to a scatter.
             self.encoder = OneHotEncoder(
-                sparse_output=False,
+                categories=[
+                    np.arange(len(levels))
+                    for levels in self._categorical_levels.values()
+                ],
+                sparse_output=True,
                 handle_unknown="ignore",
+                dtype=np.float32,
             )
-            self.encoder.fit(df_tmp[self.cat_cols])
+            self.encoder.fit(self._encoder_input(df_tmp))
+            self._encoded_colnames = self._feature_names()
             
         # Fit StandardScaler on numerical columns (if scaling is enabled).
         # This learns the mean and standard deviation of each numeric feature
         # so future data can be standardized in the same way.
         if self.do_scaling and self.num_cols:
-            self.scaler = StandardScaler()
-            self.scaler.fit(df_tmp[self.num_cols])
+            # copy=False lets transform() scale its input array in place.
+            # Fit on a plain array so transform() can pass one as well.
+            self.scaler = StandardScaler(copy=False)
+            self.scaler.fit(df_tmp[self.num_cols].to_numpy(dtype=np.float32))
 
         return self
 
+    def _transform_engineered(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply encoding and scaling to a DataFrame that already contains the
+        engineered features.
+
+        Args:
+            df_out (pandas.DataFrame): DataFrame returned by
+                add_engineered_features.
+
+        Returns:
+            pandas.DataFrame: The fully transformed DataFrame.
+        """
+        # If categorical columns are defined, apply one-hot encoding using
+        # the already-fitted encoder. This replaces all categorical fields
+        # with their corresponding encoded vectors.
+        if self.cat_cols:
+            df_out = self._encode_categorical(df_out)
+
+        # If numeric scaling is enabled and numerical columns exist,
+        # standardize them using the fitted StandardScaler. This ensures
+        # consistent scaling between train and test data.
+        if self.do_scaling and self.num_cols:
+            df_out = self._scale_numeric(df_out)
+
+        return df_out
+
+    # ---------- public API (sklearn-like) ----------
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Fit the encoder and scaler on the provided training DataFrame.
+
+        This method prepares the transformation pipeline by fitting the
+        OneHotEncoder on categorical columns and the StandardScaler on
+        numerical columns. It should only be called on the training data.
+
+        Args:
+            df (pandas.DataFrame): Input training DataFrame used to learn
+                categorical values and scaling statistics.
+
+        Returns:
+            HotelTransformer: The fitted transformer instance.
+        """
+        # First, apply feature engineering so that new columns are included
+        # when fitting both the encoder and the scaler.
+        return self._fit_engineered(self.add_engineered_features(df))
+
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply all fitted transformations to the input DataFrame.
@@ -202,21 +366,63 @@ class HotelTransformer:
 
         # Apply feature engineering first so that the new columns are included
         # in all subsequent transformation steps.
-        df_out = self.add_engineered_features(df)
+        return self._transform_engineered(self.add_engineered_features(df))
 
-        # If categorical columns are defined, apply one-hot encoding using
-        # the already-fitted encoder. This replaces all categorical fields
-        # with their corresponding encoded vectors.
-        if self.cat_cols:
-            df_out = self._encode_categorical(df_out)
+    def transform_matrix(self, df: pd.DataFrame) -> np.ndarray | sparse.csr_matrix:
+        """
+        Apply all fitted transformations and return a model-ready matrix.
 
-        # If numeric scaling is enabled and numerical columns exist,
-        # standardize them using the fitted StandardScaler. This ensures
-        # consistent scaling between train and test data.
+        Produces the same features as transform(), but skips building
+        intermediate DataFrames: the numeric columns are extracted once as a
+        float32 array, scaled, and stacked with the sparse one-hot
+        block. Columns follow the order of transform(); non-numeric columns
+        that are not listed in cat_cols are left out.
+
+        Args:
+            df (pandas.DataFrame): The input DataFrame to transform.
+
+        Returns:
+            numpy.ndarray | scipy.sparse.csr_matrix: Dense float32 matrix if
+                no categorical columns are defined, otherwise a sparse CSR
+                matrix with the numeric block followed by the encoded block.
+
+        Raises:
+            RuntimeError: If transform_matrix is called before fit has been run.
+            ValueError: If a column in num_cols is not numeric or is also
+                listed in cat_cols.
+        """
+        df_eng = self.add_engineered_features(df)
+
+        # Numeric block: every numeric column that is not encoded, as float32.
+        keep_cols = [
+            col
+            for col in df_eng.select_dtypes(include="number").columns
+            if col not in self.cat_cols
+        ]
+        num_arr = df_eng[keep_cols].to_numpy(dtype=np.float32)
+
+        # Standardize the scaled columns of the numeric block. Selecting them
+        # by position yields a temporary copy, which the scaler (copy=False)
+        # then scales in place before it is written back.
         if self.do_scaling and self.num_cols:
-            df_out = self._scale_numeric(df_out)
+            if self.scaler is None:
+                raise RuntimeError("Scaler is not fitted. Call `fit` or `fit_transform` first.")
+            invalid = [col for col in self.num_cols if col not in keep_cols]
+            if invalid:
+                raise ValueError(
+                    f"num_cols must be numeric and not listed in cat_cols: {invalid}"
+                )
+            idx = [keep_cols.index(col) for col in self.num_cols]
+            num_arr[:, idx] = self.scaler.transform(num_arr[:, idx], copy=False)
 
-        return df_out
+        if not self.cat_cols:
+            return num_arr
+
+        if self.encoder is None:
+            raise RuntimeError("Encoder is not fitted. Call `fit` or `fit_transform` first.")
+        encoded = self.encoder.transform(self._encoder_input(df_eng))
+
+        return sparse.hstack([num_arr, encoded], format="csr")
 
     def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -224,6 +430,7 @@ class HotelTransformer:
 
         This is a convenience method that combines fit() and transform()
         into a single call, similar to sklearn's fit_transform() pattern.
+        Feature engineering runs only once and no state is kept between calls.
 
         Args:
             df (pandas.DataFrame): The input DataFrame used to both fit
@@ -233,5 +440,6 @@ class HotelTransformer:
             pandas.DataFrame: The transformed DataFrame with all preprocessing
                 steps applied.
         """
-        self.fit(df)
-        return self.transform(df)
+        df_eng = self.add_engineered_features(df)
+        self._fit_engineered(df_eng)
+        return self._transform_engineered(df_eng)
@@ -17,6 +17,9 @@ DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 
+# Directories already ensured in this session (skip repeated mkdir calls)
+_ensured_dirs: set[Path] = set()
+
 
 def ensure_dir(path: Union[str, Path]) -> Path:
     """
@@ -25,6 +28,8 @@ def ensure_dir(path: Union[str, Path]) -> Path:
     This function creates the directory (including parent directories)
     if it does not already exist. Always returns the directory as a Path
     object, regardless of whether it was newly created or previously existed.
+    Each directory is only created once per session; later calls return
+    immediately without touching the filesystem.
 
     Args:
         path (str | Path): Path to the directory that should be ensured.
@@ -35,8 +40,16 @@ def ensure_dir(path: Union[str, Path]) -> Path:
     # Convert input to Path object
     path = Path(path)
 
+    # Skip the mkdir system call for directories ensured before. The memo is
+    # keyed on the absolute path so a relative path still maps to the right
+    # directory after the working directory changes (e.g. os.chdir).
+    key = path.absolute()
+    if key in _ensured_dirs:
+        return path
+
     # Create directory if it does not exist (including parent folders)
     path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(key)
     
     return path
 
@@ -72,30 +85,37 @@ def get_fig_path(name: str, ext: str = "png") -> Path:
     return FIG_DIR / name
 
 
-def save_current_fig(name: str, dpi: int = 300, tight: bool = True) -> Path:
+def save_current_fig(name: str, dpi: int = 150, tight: bool = True, ext: str = "png") -> Path:
     """
     Save the currently active Matplotlib figure.
 
     Saves the figure inside PROJECT_ROOT/reports/figures/ under the specified name.
-    Optionally applies tight layout before saving.
+    Optionally applies tight layout before saving. Lossy formats (jpg/webp)
+    are written with quality 85.
 
     Args:
         name (str): Name of the figure file (without extension).
-        dpi (int, optional): Image resolution. Defaults to 300.
+        dpi (int, optional): Image resolution. Defaults to 150, which is
+            sharp on screen and four times fewer pixels to encode than 300.
         tight (bool, optional): Apply tight_layout() before saving. Defaults to True.
+        ext (str, optional): File format/extension. Defaults to "png".
 
     Returns:
         Path: Path to the saved figure file.
     """
     # Build the full path where the figure will be saved
-    fig_path = get_fig_path(name)
+    fig_path = get_fig_path(name, ext=ext)
     
     # Apply tight layout if requested
     if tight:
         plt.tight_layout()
 
+    # Lossy formats are encoded by Pillow; keep them small but clean. Other
+    # backends (pdf, svg, ps) do not accept pil_kwargs, so only pass it here.
+    kwargs = {"pil_kwargs": {"quality": 85}} if ext.lower() in ("jpg", "jpeg", "webp") else {}
+
     # Save the active Matplotlib figure
-    plt.savefig(fig_path, dpi=dpi)
+    plt.savefig(fig_path, dpi=dpi, **kwargs)
 
     return fig_path
 